@@ -1,15 +1,20 @@
 """
 AI Self-Driving Car Game - Web Version
-Custom Neural Network (no external dependencies)
+Custom Neural Network (NumPy only)
 Works with pygbag for browser deployment!
 """
 
 import pygame
-import math
+import numpy as np
 import random
 import asyncio
 import time
 
+try:
+    from numba import njit
+except ImportError:  # Optional: not available in the browser build
+    njit = None
+
 # Initialize Pygame
 pygame.init()
 
@@ -39,6 +44,19 @@ UI_TEXT = (255, 255, 255)
 UI_SUCCESS = (50, 255, 100)
 UI_WARNING = (255, 200, 50)
 
+# Fonts
+FONT_TITLE = pygame.font.Font(None, 30)
+FONT_STAT = pygame.font.Font(None, 24)
+FONT_HINT = pygame.font.Font(None, 22)
+FONT_BIG = pygame.font.Font(None, 72)
+FONT_MED = pygame.font.Font(None, 36)
+FONT_HUGE = pygame.font.Font(None, 64)
+
+# Static text, rendered once
+HINT_TEXT = FONT_HINT.render("[R] Restart  [P] Pause  [S] Skip Gen  [T] Turbo", True, (180, 180, 180))
+PAUSED_TEXT = FONT_BIG.render("PAUSED", True, UI_ACCENT)
+RESUME_TEXT = FONT_MED.render("Press P or SPACE to resume", True, WHITE)
+
 # Game settings
 CAR_SIZE_X = 35
 CAR_SIZE_Y = 18
@@ -47,102 +65,142 @@ ROTATION_SPEED = 5
 SENSOR_LENGTH = 180
 FPS = 60
 POPULATION_SIZE = 25
+SHOW_ALL_RADARS = False  # False: only draw the sensors of the car furthest around the track
+TURBO_DRAW_INTERVAL = 100  # Ticks between frames in turbo mode
+RADAR_REFRESH_TICKS = 3  # Each car re-casts its rays every this many ticks
+RADAR_ANGLES = np.array([-90, -45, 0, 45, 90])
+RAY_STEPS = np.arange(5, SENSOR_LENGTH + 1, 5)
+# Sensor color by hit distance: red (near wall) to green (far)
+RADAR_DANGER = [1 - d / SENSOR_LENGTH for d in range(SENSOR_LENGTH + 1)]
+RADAR_COLOR = [(int(255 * danger), int(255 * (1 - danger)), 0) for danger in RADAR_DANGER]
+
+# Trig lookup tables indexed by whole degrees (angles only move in ROTATION_SPEED steps)
+COS_TABLE = np.cos(np.radians(np.arange(360)))
+SIN_TABLE = np.sin(np.radians(np.arange(360)))
 
 # Global state
 current_generation = 0
 best_fitness_ever = 0
 paused = False
+turbo = False  # Train without rendering or frame limiting
+
+# Random generator for network weights and evolution
+RNG = np.random.default_rng()
 
 # Track surfaces
 TRACK_SURFACE = None
-COLLISION_SURFACE = None
+DRIVABLE = None  # (WIDTH, HEIGHT) bool collision mask, True = road
+
+
+def quantize(weights):
+    """Quantize float weights (count, rows, cols) to int8 with one scale per network
+    
+    Returns (q, scale) such that weights ~= q * scale.
+    """
+    scale = np.abs(weights).max(axis=(1, 2), keepdims=True) / 127
+    scale[scale == 0] = 1
+    return np.round(weights / scale).astype(np.int8), scale.astype(np.float32)
 
 
 class NeuralNetwork:
-    """Simple feedforward neural network"""
+    """Population of feedforward networks, one row per car
     
-    def __init__(self, layers=None):
+    Weights are stored as int8 with a per-network, per-layer float scale;
+    biases stay float32.
+    """
+    
+    def __init__(self, count=POPULATION_SIZE, layers=None):
         # Network structure: 5 inputs -> 6 hidden -> 2 outputs
         self.input_size = 5
         self.hidden_size = 6
         self.output_size = 2
         
         if layers:
-            self.weights_ih = layers['w_ih']
-            self.weights_ho = layers['w_ho']
+            self.weights_ih, self.scale_ih = layers['w_ih'], layers['s_ih']
+            self.weights_ho, self.scale_ho = layers['w_ho'], layers['s_ho']
             self.bias_h = layers['b_h']
             self.bias_o = layers['b_o']
         else:
             # Random initialization
-            self.weights_ih = [[random.uniform(-1, 1) for _ in range(self.input_size)] 
-                              for _ in range(self.hidden_size)]
-            self.weights_ho = [[random.uniform(-1, 1) for _ in range(self.hidden_size)] 
-                              for _ in range(self.output_size)]
-            self.bias_h = [random.uniform(-1, 1) for _ in range(self.hidden_size)]
-            self.bias_o = [random.uniform(-1, 1) for _ in range(self.output_size)]
-    
-    def tanh(self, x):
-        """Activation function"""
-        return math.tanh(max(-500, min(500, x)))
+            self.weights_ih, self.scale_ih = quantize(RNG.uniform(-1, 1, (count, self.hidden_size, self.input_size)))
+            self.weights_ho, self.scale_ho = quantize(RNG.uniform(-1, 1, (count, self.output_size, self.hidden_size)))
+            self.bias_h = RNG.uniform(-1, 1, (count, self.hidden_size)).astype(np.float32)
+            self.bias_o = RNG.uniform(-1, 1, (count, self.output_size)).astype(np.float32)
+        self.count = len(self.weights_ih)
+        
+        # Scratch buffers reused by every forward pass
+        self._hidden = np.empty((self.count, self.hidden_size), np.float32)
+        self._output = np.empty((self.count, self.output_size), np.float32)
     
     def forward(self, inputs):
-        """Forward pass through network"""
-        # Hidden layer
-        hidden = []
-        for i in range(self.hidden_size):
-            total = self.bias_h[i]
-            for j in range(self.input_size):
-                total += inputs[j] * self.weights_ih[i][j]
-            hidden.append(self.tanh(total))
-        
-        # Output layer
-        outputs = []
-        for i in range(self.output_size):
-            total = self.bias_o[i]
-            for j in range(self.hidden_size):
-                total += hidden[j] * self.weights_ho[i][j]
-            outputs.append(self.tanh(total))
-        
-        return outputs
-    
-    def copy(self):
-        """Create a copy of this network"""
-        return NeuralNetwork({
-            'w_ih': [row[:] for row in self.weights_ih],
-            'w_ho': [row[:] for row in self.weights_ho],
-            'b_h': self.bias_h[:],
-            'b_o': self.bias_o[:]
+        """Forward pass for every network at once: (count, 5) float32 -> (count, 2)
+        
+        The result is a scratch buffer that the next call overwrites.
+        """
+        # (q * scale) @ x == scale * (q @ x), so the scale is applied after the product
+        hidden, output = self._hidden, self._output
+        np.einsum('pij,pj->pi', self.weights_ih, inputs, out=hidden)
+        hidden *= self.scale_ih[:, :, 0]
+        hidden += self.bias_h
+        np.tanh(hidden, out=hidden)
+        np.einsum('pij,pj->pi', self.weights_ho, hidden, out=output)
+        output *= self.scale_ho[:, :, 0]
+        output += self.bias_o
+        return np.tanh(output, out=output)
+    
+    def select(self, indices):
+        """Create a new population from copies of the given networks"""
+        return NeuralNetwork(layers={
+            'w_ih': self.weights_ih[indices],
+            's_ih': self.scale_ih[indices],
+            'w_ho': self.weights_ho[indices],
+            's_ho': self.scale_ho[indices],
+            'b_h': self.bias_h[indices],
+            'b_o': self.bias_o[indices]
         })
     
-    def mutate(self, rate=0.2):
-        """Mutate weights and biases"""
-        for i in range(self.hidden_size):
-            for j in range(self.input_size):
-                if random.random() < rate:
-                    self.weights_ih[i][j] += random.gauss(0, 0.5)
-                    self.weights_ih[i][j] = max(-2, min(2, self.weights_ih[i][j]))
+    def mutate(self, rate=0.2, start=0):
+        """Mutate weights and biases of every network from index `start` on"""
+        quantized = [(self.weights_ih, self.scale_ih), (self.weights_ho, self.scale_ho)]
+        # Weights get their noise in float space and are re-quantized after
+        weights = [q[start:] * scale[start:] for q, scale in quantized]
+        params = weights + [self.bias_h[start:], self.bias_o[start:]]
+        sigmas = (0.5, 0.5, 0.3, 0.3)
         
-        for i in range(self.output_size):
-            for j in range(self.hidden_size):
-                if random.random() < rate:
-                    self.weights_ho[i][j] += random.gauss(0, 0.5)
-                    self.weights_ho[i][j] = max(-2, min(2, self.weights_ho[i][j]))
+        # One draw for all the noise and one for all the masks
+        sizes = [param.size for param in params]
+        noise = RNG.standard_normal(sum(sizes), dtype=np.float32)
+        noise[RNG.random(sum(sizes)) >= rate] = 0
+        for param, chunk, sigma in zip(params, np.split(noise, np.cumsum(sizes)[:-1]), sigmas):
+            param += sigma * chunk.reshape(param.shape)
         
-        for i in range(self.hidden_size):
-            if random.random() < rate:
-                self.bias_h[i] += random.gauss(0, 0.3)
-        
-        for i in range(self.output_size):
-            if random.random() < rate:
-                self.bias_o[i] += random.gauss(0, 0.3)
+        for (q, scale), w in zip(quantized, weights):
+            np.clip(w, -2, 2, out=w)
+            q[start:], scale[start:] = quantize(w)
+
+
+def curb_points(points, spacing):
+    """Curb stone positions every `spacing` px along a closed polygon
+    
+    Returns integer positions (N, 2) and each stone's index within its edge.
+    """
+    edges = np.roll(points, -1, axis=0) - points
+    lengths = np.hypot(edges[:, 0], edges[:, 1])
+    counts = (lengths / spacing).astype(int)
+    
+    edge = np.repeat(np.arange(len(points)), counts)
+    index = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = index / (lengths[edge] / spacing)
+    positions = (points[edge] + t[:, None] * edges[edge]).astype(int)
+    return positions, index
 
 
 def create_track():
     """Create the race track"""
-    global TRACK_SURFACE, COLLISION_SURFACE
+    global TRACK_SURFACE, DRIVABLE
     
-    COLLISION_SURFACE = pygame.Surface((WIDTH, HEIGHT))
-    COLLISION_SURFACE.fill(BLACK)
+    collision_surface = pygame.Surface((WIDTH, HEIGHT))
+    collision_surface.fill(BLACK)
     
     TRACK_SURFACE = pygame.Surface((WIDTH, HEIGHT))
     TRACK_SURFACE.fill(GRASS_DARK)
@@ -162,24 +220,19 @@ def create_track():
     
     # Generate oval points
     num_points = 80
-    outer_points, inner_points = [], []
-    
-    for i in range(num_points):
-        angle = (2 * math.pi * i) / num_points
-        outer_points.append((cx + outer_rx * math.cos(angle), cy + outer_ry * math.sin(angle)))
-        inner_points.append((cx + inner_rx * math.cos(angle), cy + inner_ry * math.sin(angle)))
-    
-    # Collision surface (white = drivable)
-    pygame.draw.polygon(COLLISION_SURFACE, WHITE, outer_points)
-    pygame.draw.polygon(COLLISION_SURFACE, BLACK, inner_points)
-    
-    # Sand traps
-    sand_points = []
-    for ox, oy in outer_points:
-        dx, dy = ox - cx, oy - cy
-        length = math.sqrt(dx*dx + dy*dy)
-        if length > 0:
-            sand_points.append((ox + dx/length * 25, oy + dy/length * 25))
+    angles = 2 * np.pi * np.arange(num_points) / num_points
+    unit = np.column_stack([np.cos(angles), np.sin(angles)])
+    outer_points = (cx, cy) + unit * (outer_rx, outer_ry)
+    inner_points = (cx, cy) + unit * (inner_rx, inner_ry)
+    
+    # Collision mask (white = drivable); nothing reads the surface afterwards
+    pygame.draw.polygon(collision_surface, WHITE, outer_points)
+    pygame.draw.polygon(collision_surface, BLACK, inner_points)
+    DRIVABLE = pygame.surfarray.pixels_red(collision_surface) >= 50
+    
+    # Sand traps: outer edge pushed 25 px away from the center
+    offsets = outer_points - (cx, cy)
+    sand_points = outer_points + offsets / np.hypot(offsets[:, 0], offsets[:, 1])[:, None] * 25
     pygame.draw.polygon(TRACK_SURFACE, SAND_COLOR, sand_points)
     
     # Track asphalt
@@ -188,16 +241,9 @@ def create_track():
     
     # Curbs
     for points in [outer_points, inner_points]:
-        for i in range(len(points)):
-            p1, p2 = points[i], points[(i + 1) % len(points)]
-            dx, dy = p2[0] - p1[0], p2[1] - p1[1]
-            length = math.sqrt(dx*dx + dy*dy)
-            if length > 0:
-                for j in range(int(length / 12)):
-                    t = j / (length / 12)
-                    x, y = p1[0] + dx * t, p1[1] + dy * t
-                    color = CURB_RED if j % 2 == 0 else CURB_WHITE
-                    pygame.draw.circle(TRACK_SURFACE, color, (int(x), int(y)), 6)
+        positions, index = curb_points(points, 12)
+        for pos, j in zip(positions.tolist(), index.tolist()):
+            pygame.draw.circle(TRACK_SURFACE, CURB_RED if j % 2 == 0 else CURB_WHITE, pos, 6)
     
     # Track lines
     pygame.draw.lines(TRACK_SURFACE, WHITE, True, outer_points, 3)
@@ -211,10 +257,12 @@ def create_track():
             pygame.draw.rect(TRACK_SURFACE, color, (start_x + col * 10, cy - 40 + row * 10, 10, 10))
     
     # Pit area text
-    font = pygame.font.Font(None, 24)
     pygame.draw.rect(TRACK_SURFACE, (50, 50, 60), (cx - 70, cy - 40, 140, 80))
-    text = font.render("PIT LANE", True, WHITE)
+    text = FONT_STAT.render("PIT LANE", True, WHITE)
     TRACK_SURFACE.blit(text, (cx - 38, cy - 8))
+    
+    # Match the display's pixel format so per-frame blits are plain copies
+    TRACK_SURFACE = TRACK_SURFACE.convert()
 
 
 def create_car_sprite(color):
@@ -242,154 +290,220 @@ def create_car_sprite(color):
     for pos in [(2, 0), (2, CAR_SIZE_Y - 5), (CAR_SIZE_X - 14, 0), (CAR_SIZE_X - 14, CAR_SIZE_Y - 5)]:
         pygame.draw.ellipse(surface, (30, 30, 30), (*pos, 8, 5))
     
-    return surface
+    return surface.convert_alpha()
 
 
 # Create assets
 create_track()
 CAR_SPRITES = [create_car_sprite(c) for c in CAR_COLORS]
+# Every sprite pre-rotated to each whole degree: CAR_SPRITES_ROT[sprite][angle]
+CAR_SPRITES_ROT = [[pygame.transform.rotate(s, a).convert_alpha() for a in range(360)] for s in CAR_SPRITES]
 
 
-class Car:
-    """Self-driving car with neural network brain"""
+class CarFleet:
+    """All cars of a generation, one NumPy array per attribute
+    
+    Car i is driven by row i of the generation's NeuralNetwork.
+    """
     
-    def __init__(self, car_id=0, brain=None):
-        self.sprite = CAR_SPRITES[car_id % len(CAR_SPRITES)]
-        self.color = CAR_COLORS[car_id % len(CAR_COLORS)]
+    def __init__(self, count=POPULATION_SIZE):
+        self.count = count
+        self.sprites = [CAR_SPRITES_ROT[i % len(CAR_SPRITES)] for i in range(count)]
         
-        # Starting position (left side of oval)
-        self.x = WIDTH // 2 - 480 + 45
-        self.y = HEIGHT // 2 - CAR_SIZE_Y // 2
-        self.angle = 90  # Facing up
+        # Starting position (left side of oval), facing up
+        self.x = np.full(count, WIDTH // 2 - 480 + 45, np.float64)
+        self.y = np.full(count, HEIGHT // 2 - CAR_SIZE_Y // 2, np.float64)
+        self.angle = np.full(count, 90)
         
-        self.alive = True
-        self.fitness = 0
-        self.distance = 0
+        self.alive = np.ones(count, bool)
+        self.live = np.arange(count)  # Indices of alive cars, shrunk as cars crash
+        self.fitness = np.zeros(count)
+        self.distance = np.zeros(count)
         
-        self.brain = brain if brain else NeuralNetwork()
-        self.radars = []
-        self.radar_angles = [-90, -45, 0, 45, 90]
+        # Track progress: angle swept around the oval center, in radians (positive = racing direction)
+        self.track_angle = self.angle_around()
+        self.progress = np.zeros(count)
+        
+        self.radar_ends = np.zeros((count, len(RADAR_ANGLES), 2), np.int32)
+        self.radar_lengths = np.zeros((count, len(RADAR_ANGLES)), np.float32)
+        # Staggered so each tick only casts for a third of the fleet
+        self.radar_phase = np.arange(count) % RADAR_REFRESH_TICKS
+        self.update_radars()
     
     def draw(self, win):
-        if not self.alive:
-            return
-        rotated = pygame.transform.rotate(self.sprite, self.angle)
-        rect = rotated.get_rect(center=(self.x + CAR_SIZE_X // 2, self.y + CAR_SIZE_Y // 2))
-        win.blit(rotated, rect.topleft)
-    
-    def draw_radars(self, win):
-        if not self.alive:
-            return
-        cx, cy = self.x + CAR_SIZE_X // 2, self.y + CAR_SIZE_Y // 2
-        for pos, dist in self.radars:
-            danger = 1 - (dist / SENSOR_LENGTH)
-            color = (int(255 * danger), int(255 * (1 - danger)), 0)
-            pygame.draw.line(win, color, (cx, cy), pos, 2)
-            pygame.draw.circle(win, color, pos, 4)
+        """Draw live cars; returns the screen rects touched"""
+        rects = []
+        for i in self.live:
+            rotated = self.sprites[i][self.angle[i] % 360]
+            rect = rotated.get_rect(center=(self.x[i] + CAR_SIZE_X // 2, self.y[i] + CAR_SIZE_Y // 2))
+            rects.append(win.blit(rotated, rect.topleft))
+        return rects
+    
+    def draw_radars(self, win, only_best=False):
+        """Draw sensor rays; returns the screen rects touched"""
+        rects = []
+        live = self.live
+        if only_best and len(live):
+            live = live[[self.progress[live].argmax()]]
+        for i in live:
+            cx, cy = self.x[i] + CAR_SIZE_X // 2, self.y[i] + CAR_SIZE_Y // 2
+            for pos, dist in zip(self.radar_ends[i], self.radar_lengths[i]):
+                color = RADAR_COLOR[int(dist)]
+                rects.append(pygame.draw.line(win, color, (cx, cy), pos, 2))
+                rects.append(pygame.draw.circle(win, color, pos, 4))
+        return rects
     
     def check_collision(self):
-        cx, cy = int(self.x + CAR_SIZE_X // 2), int(self.y + CAR_SIZE_Y // 2)
-        if not (0 <= cx < WIDTH and 0 <= cy < HEIGHT):
-            self.alive = False
-            return
-        try:
-            if COLLISION_SURFACE.get_at((cx, cy))[0] < 50:
-                self.alive = False
-        except:
-            self.alive = False
-    
-    def cast_ray(self, angle_offset):
-        length = 0
-        target = math.radians(self.angle + angle_offset)
-        sx, sy = self.x + CAR_SIZE_X // 2, self.y + CAR_SIZE_Y // 2
-        ex, ey = sx, sy
-        
-        while length < SENSOR_LENGTH:
-            length += 5
-            ex = int(sx + math.cos(target) * length)
-            ey = int(sy - math.sin(target) * length)
-            if not (0 <= ex < WIDTH and 0 <= ey < HEIGHT):
-                break
-            try:
-                if COLLISION_SURFACE.get_at((ex, ey))[0] < 50:
-                    break
-            except:
-                break
+        """Kill live cars whose center is off the track"""
+        live = self.live
+        cx = (self.x[live] + CAR_SIZE_X // 2).astype(np.int32)
+        cy = (self.y[live] + CAR_SIZE_Y // 2).astype(np.int32)
+        inside = (cx >= 0) & (cx < WIDTH) & (cy >= 0) & (cy < HEIGHT)
+        on_road = DRIVABLE[np.clip(cx, 0, WIDTH - 1), np.clip(cy, 0, HEIGHT - 1)]
+        on_track = inside & on_road
+        self.alive[live] = on_track
+        self.live = live[on_track]
+    
+    def update_radars(self, ticks=None):
+        """Cast the rays of live cars due a refresh this tick (all of them if ticks is None)
         
-        self.radars.append(((ex, ey), length))
-    
-    def update_radars(self):
-        self.radars.clear()
-        for angle in self.radar_angles:
-            self.cast_ray(angle)
+        Cars in between keep their last readings as network inputs.
+        """
+        live = self.live
+        if ticks is not None:
+            live = live[self.radar_phase[live] == ticks % RADAR_REFRESH_TICKS]
+        self.radar_ends[live], self.radar_lengths[live] = cast_rays(self.x[live], self.y[live], self.angle[live])
     
     def get_inputs(self):
-        return [r[1] / SENSOR_LENGTH for r in self.radars]
+        return self.radar_lengths * (1 / SENSOR_LENGTH)
     
-    def think(self):
-        """Use neural network to decide movement"""
-        inputs = self.get_inputs()
-        outputs = self.brain.forward(inputs)
-        
-        if outputs[0] > 0.5:
-            self.angle += ROTATION_SPEED
-        if outputs[1] > 0.5:
-            self.angle -= ROTATION_SPEED
+    def steer(self, outputs):
+        """Turn every live car according to its network outputs"""
+        live = self.live
+        turn = (outputs[live, 0] > 0.5).astype(int) - (outputs[live, 1] > 0.5).astype(int)
+        self.angle[live] += ROTATION_SPEED * turn
     
     def update(self):
-        if not self.alive:
-            return
+        """Move every live car forward"""
+        live = self.live
+        heading = self.angle[live] % 360
+        self.x[live] += COS_TABLE[heading] * CAR_SPEED
+        self.y[live] -= SIN_TABLE[heading] * CAR_SPEED
         
-        # Move forward
-        self.x += math.cos(math.radians(self.angle)) * CAR_SPEED
-        self.y -= math.sin(math.radians(self.angle)) * CAR_SPEED
+        self.distance[live] += CAR_SPEED
+        self.fitness[live] += 0.1
         
-        self.distance += CAR_SPEED
-        self.fitness += 0.1
+        around = self.angle_around(live)
+        self.progress[live] += (around - self.track_angle[live] + np.pi) % (2 * np.pi) - np.pi
+        self.track_angle[live] = around
         
         self.check_collision()
-        self.update_radars()
-        self.think()
+    
+    def angle_around(self, cars=slice(None)):
+        """Screen angle of the given cars' centers around the track center"""
+        return np.arctan2(self.y[cars] + CAR_SIZE_Y // 2 - HEIGHT // 2, self.x[cars] + CAR_SIZE_X // 2 - WIDTH // 2)
 
 
-def draw_ui(alive, total, ticks, max_ticks):
-    """Draw game UI"""
+if njit:
+    @njit(cache=True)
+    def _cast_rays_jit(drivable, sx, sy, cos_t, sin_t, ends, lengths):
+        """Ray march with early exit on the first blocked pixel"""
+        width, height = drivable.shape
+        for i in range(cos_t.shape[0]):
+            for r in range(cos_t.shape[1]):
+                length, ex, ey = 0, 0, 0
+                while length < SENSOR_LENGTH:
+                    length += 5
+                    ex = int(sx[i] + cos_t[i, r] * length)
+                    ey = int(sy[i] - sin_t[i, r] * length)
+                    if not (0 <= ex < width and 0 <= ey < height) or not drivable[ex, ey]:
+                        break
+                ends[i, r, 0], ends[i, r, 1] = ex, ey
+                lengths[i, r] = length
+
+
+def cast_rays(xs, ys, angles):
+    """Cast every radar ray of every given car at once
+    
+    Returns ray end points (N, 5, 2) and hit distances (N, 5).
+    """
+    ray_angles = (angles[:, None] + RADAR_ANGLES) % 360
+    cos_t, sin_t = COS_TABLE[ray_angles], SIN_TABLE[ray_angles]
+    sx = xs + CAR_SIZE_X // 2
+    sy = ys + CAR_SIZE_Y // 2
+    
+    if njit:
+        ends = np.empty(cos_t.shape + (2,), np.int32)
+        lengths = np.empty(cos_t.shape, RAY_STEPS.dtype)
+        _cast_rays_jit(DRIVABLE, sx, sy, cos_t, sin_t, ends, lengths)
+        return ends, lengths
+    
+    # Sample every ray at every step: (N, 5, steps)
+    ex = (sx[:, None, None] + cos_t[:, :, None] * RAY_STEPS).astype(np.int32)
+    ey = (sy[:, None, None] - sin_t[:, :, None] * RAY_STEPS).astype(np.int32)
+    inside = (ex >= 0) & (ex < WIDTH) & (ey >= 0) & (ey < HEIGHT)
+    blocked = ~inside | ~DRIVABLE[np.clip(ex, 0, WIDTH - 1), np.clip(ey, 0, HEIGHT - 1)]
+    
+    # First blocked step; rays that never hit stop at SENSOR_LENGTH
+    blocked[:, :, -1] = True
+    hit = blocked.argmax(axis=2)[:, :, None]
+    ends = np.stack([np.take_along_axis(ex, hit, 2), np.take_along_axis(ey, hit, 2)], axis=-1)[:, :, 0]
+    return ends, RAY_STEPS[hit[:, :, 0]]
+
+
+def create_ui_panel():
+    """Create the static stats panel background (gradient, border, title, labels)"""
     panel = pygame.Surface((250, 170), pygame.SRCALPHA)
     
     for i in range(170):
         pygame.draw.line(panel, (20, 25, 40, 200 - i // 3), (0, i), (250, i))
     pygame.draw.rect(panel, UI_ACCENT, (0, 0, 250, 170), 2, border_radius=10)
     
-    font_title = pygame.font.Font(None, 30)
-    font = pygame.font.Font(None, 24)
-    
-    panel.blit(font_title.render("NEURAL RACING", True, UI_ACCENT), (15, 10))
+    panel.blit(FONT_TITLE.render("NEURAL RACING", True, UI_ACCENT), (15, 10))
     pygame.draw.line(panel, UI_ACCENT, (15, 38), (235, 38), 2)
     
-    stats = [
-        ("Generation", str(current_generation), UI_TEXT),
-        ("Cars Alive", f"{alive}/{total}", UI_SUCCESS if alive > total // 2 else UI_WARNING),
-        ("Time", f"{ticks}/{max_ticks}", UI_TEXT),
-        ("Best Fitness", f"{best_fitness_ever:.0f}", UI_ACCENT),
-    ]
-    
     y = 48
-    for label, value, color in stats:
-        panel.blit(font.render(f"{label}:", True, (150, 150, 170)), (15, y))
-        val_surf = font.render(value, True, color)
-        panel.blit(val_surf, (235 - val_surf.get_width(), y))
+    for label in ("Generation", "Cars Alive", "Time", "Best Fitness"):
+        panel.blit(FONT_STAT.render(f"{label}:", True, (150, 150, 170)), (15, y))
         y += 26
+    return panel
+
+
+UI_PANEL_BG = create_ui_panel()
+# Last rendered stats panel and the stats it shows
+_ui_cache = {'key': None, 'surf': None}
+
+
+def draw_ui(alive, total, ticks, max_ticks):
+    """Draw game UI; returns the screen rects touched"""
+    # Only re-render the panel when a shown stat changes (time at ~10 Hz)
+    key = (current_generation, alive, ticks // 6, f"{best_fitness_ever:.0f}")
+    if key != _ui_cache['key']:
+        panel = UI_PANEL_BG.copy()
+        
+        stats = [
+            (str(current_generation), UI_TEXT),
+            (f"{alive}/{total}", UI_SUCCESS if alive > total // 2 else UI_WARNING),
+            (f"{ticks}/{max_ticks}", UI_TEXT),
+            (f"{best_fitness_ever:.0f}", UI_ACCENT),
+        ]
+        
+        y = 48
+        for value, color in stats:
+            val_surf = FONT_STAT.render(value, True, color)
+            panel.blit(val_surf, (235 - val_surf.get_width(), y))
+            y += 26
+        
+        # Progress bar
+        pygame.draw.rect(panel, (50, 50, 60), (15, 150, 220, 10), border_radius=5)
+        pygame.draw.rect(panel, UI_ACCENT, (15, 150, int(220 * ticks / max_ticks), 10), border_radius=5)
+        
+        _ui_cache['key'], _ui_cache['surf'] = key, panel
     
-    # Progress bar
-    pygame.draw.rect(panel, (50, 50, 60), (15, 150, 220, 10), border_radius=5)
-    pygame.draw.rect(panel, UI_ACCENT, (15, 150, int(220 * ticks / max_ticks), 10), border_radius=5)
-    
-    WIN.blit(panel, (15, 15))
+    panel_rect = WIN.blit(_ui_cache['surf'], (15, 15))
     
     # Controls
-    hint_font = pygame.font.Font(None, 22)
-    hint = hint_font.render("[R] Restart  [P] Pause  [S] Skip Gen", True, (180, 180, 180))
-    WIN.blit(hint, (15, HEIGHT - 28))
+    return [panel_rect, WIN.blit(HINT_TEXT, (15, HEIGHT - 28))]
 
 
 def draw_pause():
@@ -398,58 +512,44 @@ def draw_pause():
     overlay.fill((0, 0, 0, 150))
     WIN.blit(overlay, (0, 0))
     
-    font_big = pygame.font.Font(None, 72)
-    font_small = pygame.font.Font(None, 36)
-    
-    text = font_big.render("PAUSED", True, UI_ACCENT)
-    WIN.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 40))
-    
-    text2 = font_small.render("Press P or SPACE to resume", True, WHITE)
-    WIN.blit(text2, (WIDTH // 2 - text2.get_width() // 2, HEIGHT // 2 + 20))
+    WIN.blit(PAUSED_TEXT, (WIDTH // 2 - PAUSED_TEXT.get_width() // 2, HEIGHT // 2 - 40))
+    WIN.blit(RESUME_TEXT, (WIDTH // 2 - RESUME_TEXT.get_width() // 2, HEIGHT // 2 + 20))
 
 
-def create_next_generation(cars):
+def create_next_generation(fleet, brains):
     """Create next generation using genetic algorithm"""
     # Sort by fitness
-    cars.sort(key=lambda c: c.fitness + c.distance * 0.01, reverse=True)
-    
-    new_brains = []
+    ranking = np.argsort(-(fleet.fitness + fleet.distance * 0.01), kind='stable')
     
-    # Keep top performers
+    # Keep top performers, then create offspring from them
     elite_count = max(2, POPULATION_SIZE // 5)
-    for i in range(elite_count):
-        new_brains.append(cars[i].brain.copy())
-    
-    # Create offspring from top performers
-    while len(new_brains) < POPULATION_SIZE:
-        parent = cars[random.randint(0, elite_count - 1)]
-        child_brain = parent.brain.copy()
-        child_brain.mutate(0.2)
-        new_brains.append(child_brain)
+    offspring = ranking[RNG.integers(0, elite_count, POPULATION_SIZE - elite_count)]
+    parents = np.concatenate([ranking[:elite_count], offspring])
     
+    # Copy the chosen networks, then mutate all offspring in one pass
+    new_brains = brains.select(parents)
+    new_brains.mutate(0.2, start=elite_count)
     return new_brains
 
 
-async def run_generation(brains=None):
+async def run_generation(brains):
     """Run one generation of cars"""
-    global current_generation, best_fitness_ever, paused
+    global current_generation, best_fitness_ever, paused, turbo
     
     current_generation += 1
     
-    # Create cars
-    cars = []
-    for i in range(POPULATION_SIZE):
-        brain = brains[i] if brains and i < len(brains) else None
-        cars.append(Car(i, brain))
+    fleet = CarFleet(POPULATION_SIZE)
     
     clock = pygame.time.Clock()
     ticks = 0
     max_ticks = 1200
     skip = False
     restart = False
+    dirty = None  # Rects drawn last frame; None forces a full redraw
     
-    while ticks < max_ticks and any(c.alive for c in cars):
-        clock.tick(FPS)
+    while ticks < max_ticks and len(fleet.live):
+        if paused or not turbo:  # The pause screen stays frame limited in turbo mode
+            clock.tick(FPS)
         
         # Handle events
         for event in pygame.event.get():
@@ -462,6 +562,8 @@ async def run_generation(brains=None):
                     skip = True
                 if event.key == pygame.K_r:
                     restart = True
+                if event.key == pygame.K_t:
+                    turbo = not turbo
         
         if restart:
             return None, False, True
@@ -469,6 +571,7 @@ async def run_generation(brains=None):
         if paused:
             draw_pause()
             pygame.display.flip()
+            dirty = None
             await asyncio.sleep(0)
             continue
         
@@ -478,27 +581,38 @@ async def run_generation(brains=None):
         ticks += 1
         
         # Update cars
-        for car in cars:
-            if car.alive:
-                car.update()
-                if car.fitness > best_fitness_ever:
-                    best_fitness_ever = car.fitness
+        fleet.update()
+        best_fitness_ever = max(best_fitness_ever, float(fleet.fitness.max()))
         
-        # Draw
-        WIN.blit(TRACK_SURFACE, (0, 0))
+        # Sense and think: one batched pass for the whole population
+        fleet.update_radars(ticks)
+        fleet.steer(brains.forward(fleet.get_inputs()))
         
-        for car in cars:
-            car.draw_radars(WIN)
-        for car in cars:
-            car.draw(WIN)
+        # Turbo mode only draws (and yields to the browser) every few ticks
+        if turbo and (ticks - 1) % TURBO_DRAW_INTERVAL:
+            continue
+        
+        # Draw: restore only the track under last frame's sprites
+        if dirty is None:
+            WIN.blit(TRACK_SURFACE, (0, 0))
+        else:
+            for rect in dirty:
+                WIN.blit(TRACK_SURFACE, rect, rect)
         
-        alive_count = sum(1 for c in cars if c.alive)
-        draw_ui(alive_count, POPULATION_SIZE, ticks, max_ticks)
+        drawn = fleet.draw_radars(WIN, only_best=not SHOW_ALL_RADARS)
+        drawn += fleet.draw(WIN)
         
-        pygame.display.flip()
+        alive_count = len(fleet.live)
+        drawn += draw_ui(alive_count, POPULATION_SIZE, ticks, max_ticks)
+        
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty + drawn)
+        dirty = drawn
         await asyncio.sleep(0)  # Yield to browser
     
-    return cars, False, False
+    return fleet, False, False
 
 
 async def main():
@@ -514,7 +628,7 @@ async def main():
         
         current_generation = 0
         best_fitness_ever = 0
-        brains = None
+        brains = NeuralNetwork()
         create_track()
         
         restart_simulation = False
@@ -523,7 +637,7 @@ async def main():
         for gen in range(50):
             result = await run_generation(brains)
             
-            cars, quit_game, restart = result
+            fleet, quit_game, restart = result
             
             if quit_game:
                 return
@@ -532,9 +646,9 @@ async def main():
                 restart_simulation = True
                 break
             
-            if cars:
+            if fleet:
                 # Create next generation
-                brains = create_next_generation(cars)
+                brains = create_next_generation(fleet, brains)
         
         if restart_simulation:
             continue
@@ -543,6 +657,11 @@ async def main():
         clock = pygame.time.Clock()
         waiting = True
         
+        text1 = FONT_HUGE.render("EVOLUTION COMPLETE!", True, UI_ACCENT)
+        text2 = FONT_MED.render(f"Generations: {current_generation}", True, WHITE)
+        text3 = FONT_MED.render(f"Best Fitness: {best_fitness_ever:.0f}", True, UI_SUCCESS)
+        text4 = FONT_MED.render("Press [R] to Restart", True, (150, 255, 150))
+        
         while waiting:
             clock.tick(30)
             
@@ -560,14 +679,6 @@ async def main():
             overlay.fill((0, 0, 0, 180))
             WIN.blit(overlay, (0, 0))
             
-            font_big = pygame.font.Font(None, 64)
-            font_med = pygame.font.Font(None, 36)
-            
-            text1 = font_big.render("EVOLUTION COMPLETE!", True, UI_ACCENT)
-            text2 = font_med.render(f"Generations: {current_generation}", True, WHITE)
-            text3 = font_med.render(f"Best Fitness: {best_fitness_ever:.0f}", True, UI_SUCCESS)
-            text4 = font_med.render("Press [R] to Restart", True, (150, 255, 150))
-            
             WIN.blit(text1, (WIDTH // 2 - text1.get_width() // 2, HEIGHT // 3))
             WIN.blit(text2, (WIDTH // 2 - text2.get_width() // 2, HEIGHT // 2))
             WIN.blit(text3, (WIDTH // 2 - text3.get_width() // 2, HEIGHT // 2 + 45))
@@ -9,6 +9,17 @@ import sys
 import neat
 import os
 import random
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: falls back to the NumPy ray casting
+    njit = None
+
+try:
+    import sim_core  # Optional: compiled tick, build with `cythonize -i sim_core.pyx`
+except ImportError:
+    sim_core = None
 
 # Initialize Pygame
 pygame.init()
@@ -53,13 +64,31 @@ UI_TEXT = (255, 255, 255)
 UI_SUCCESS = (50, 255, 100)
 UI_WARNING = (255, 200, 50)
 
+# Fonts
+FONT_TITLE = pygame.font.Font(None, 36)
+FONT_STAT = pygame.font.Font(None, 28)
+FONT_HINT = pygame.font.Font(None, 22)
+FONT_BIG = pygame.font.Font(None, 72)
+FONT_MED = pygame.font.Font(None, 42)
+FONT_OPTION = pygame.font.Font(None, 32)
+
 # Game settings
 CAR_SIZE_X = 35
 CAR_SIZE_Y = 18
 CAR_SPEED = 6
 ROTATION_SPEED = 5
 SENSOR_LENGTH = 180
+RADAR_ANGLES = [-90, -45, 0, 45, 90]
+RADAR_ANGLES_ARRAY = np.array(RADAR_ANGLES, np.int64)
+RAY_STEP = 5  # Radar distances are multiples of this
+RAY_COARSE_STEP = 20  # First probe spacing along each ray, refined by bisection
+RAY_COARSE_STEPS = np.arange(RAY_COARSE_STEP, SENSOR_LENGTH + 1, RAY_COARSE_STEP)  # SENSOR_LENGTH is a multiple
+# Trig lookup tables indexed by whole degrees (angles only move in ROTATION_SPEED steps)
+COS_TABLE = np.cos(np.radians(np.arange(360)))
+SIN_TABLE = np.sin(np.radians(np.arange(360)))
 FPS = 60
+DRAW_EVERY = 2  # Simulation ticks per drawn frame (events are polled on drawn frames)
+TURBO_DRAW_INTERVAL = 100  # Ticks between frames in turbo mode
 
 # Generation counter
 current_generation = 0
@@ -70,16 +99,37 @@ restart_requested = False
 quit_requested = False
 paused = False
 fullscreen = False
+turbo = os.getenv("HEADLESS", "") not in ("", "0")  # Train without frame limiting, drawing only now and then
 
 # Track and collision surfaces
 TRACK_SURFACE = None
 COLLISION_SURFACE = None
 DECORATION_SURFACE = None
+COLLISION_MASK = None  # uint8 array indexed [y, x], 1 = off track; rebuild after drawing on COLLISION_SURFACE
+
+# Grass textures are baked into square tiles of this size and tiled over the track
+GRASS_TILE_SIZE = 256
+
+# Finished tracks by window size, so restarts and fullscreen toggles reuse them
+_track_cache = {}
 
 
 def create_smooth_track():
+    """Set up the race track for the current window size, building it on first use"""
+    global TRACK_SURFACE, COLLISION_SURFACE, DECORATION_SURFACE, COLLISION_MASK
+    
+    key = (WIDTH, HEIGHT)
+    if key not in _track_cache:
+        points = draw_smooth_track()
+        _track_cache[key] = (TRACK_SURFACE, COLLISION_SURFACE, DECORATION_SURFACE, COLLISION_MASK, points)
+    
+    TRACK_SURFACE, COLLISION_SURFACE, DECORATION_SURFACE, COLLISION_MASK, points = _track_cache[key]
+    return points
+
+
+def draw_smooth_track():
     """Create a professional-looking race track with curves"""
-    global TRACK_SURFACE, COLLISION_SURFACE, DECORATION_SURFACE
+    global TRACK_SURFACE, COLLISION_SURFACE, DECORATION_SURFACE, COLLISION_MASK
     
     # Collision surface (simple black/white for detection)
     COLLISION_SURFACE = pygame.Surface((WIDTH, HEIGHT))
@@ -131,6 +181,12 @@ def create_smooth_track():
     pygame.draw.polygon(COLLISION_SURFACE, WHITE, outer_points)
     pygame.draw.polygon(COLLISION_SURFACE, BLACK, inner_points)
     
+    # Read the red channel through a view (no surface copy) and drop it to unlock the surface.
+    # Any later drawing on COLLISION_SURFACE must be followed by rebuilding the mask.
+    red = pygame.surfarray.pixels_red(COLLISION_SURFACE)
+    COLLISION_MASK = np.ascontiguousarray(red.T < 50, dtype=np.uint8)
+    del red
+    
     # Draw sand/gravel traps
     draw_sand_traps(TRACK_SURFACE, outer_points)
     
@@ -170,22 +226,46 @@ def create_smooth_track():
     # Draw decorations
     draw_decorations(DECORATION_SURFACE, inner_points)
     
+    # Match the display's pixel format so per-frame blits are plain copies
+    TRACK_SURFACE = TRACK_SURFACE.convert()
+    DECORATION_SURFACE = DECORATION_SURFACE.convert_alpha()
+    
     return outer_points, inner_points
 
 
+def create_grass_tile(patches, min_size, max_size, pick_color):
+    """Create a seamless grass tile: random patches on GRASS_DARK, wrapped around the edges"""
+    tile = pygame.Surface((GRASS_TILE_SIZE, GRASS_TILE_SIZE))
+    tile.fill(GRASS_DARK)
+    
+    for _ in range(patches):
+        x = random.randint(0, GRASS_TILE_SIZE)
+        y = random.randint(0, GRASS_TILE_SIZE)
+        size = random.randint(min_size, max_size)
+        color = pick_color()
+        for dx in (-GRASS_TILE_SIZE, 0, GRASS_TILE_SIZE):
+            for dy in (-GRASS_TILE_SIZE, 0, GRASS_TILE_SIZE):
+                pygame.draw.circle(tile, color, (x + dx, y + dy), size)
+    
+    return tile
+
+
+def random_grass_shade():
+    """Grass color with a random brightness variation"""
+    color_var = random.randint(-15, 15)
+    return (34 + color_var, 120 + color_var, 34 + color_var)
+
+
+def blit_tiled(surface, tile):
+    """Cover a whole surface with copies of a tile"""
+    tile_width, tile_height = tile.get_size()
+    surface.blits([(tile, (x, y)) for x in range(0, surface.get_width(), tile_width)
+                   for y in range(0, surface.get_height(), tile_height)], False)
+
+
 def draw_grass_background(surface):
     """Draw textured grass background"""
-    # Base grass color
-    surface.fill(GRASS_DARK)
-    
-    # Add grass texture with random lighter patches
-    for _ in range(500):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        size = random.randint(20, 60)
-        color_var = random.randint(-15, 15)
-        color = (34 + color_var, 120 + color_var, 34 + color_var)
-        pygame.draw.circle(surface, color, (x, y), size)
+    blit_tiled(surface, GRASS_TILE)
 
 
 def draw_sand_traps(surface, outer_points):
@@ -208,21 +288,24 @@ def draw_sand_traps(surface, outer_points):
 
 
 def draw_inner_grass(surface, inner_points):
-    """Draw grass pattern inside the track"""
-    # Create inner grass with slight texture
-    for _ in range(100):
-        # Find random point inside inner area
-        min_x = min(p[0] for p in inner_points)
-        max_x = max(p[0] for p in inner_points)
-        min_y = min(p[1] for p in inner_points)
-        max_y = max(p[1] for p in inner_points)
-        
-        x = random.randint(int(min_x) + 50, int(max_x) - 50)
-        y = random.randint(int(min_y) + 50, int(max_y) - 50)
-        size = random.randint(10, 30)
-        
-        color = GRASS_LIGHT if random.random() > 0.5 else GRASS_DARK
-        pygame.draw.circle(surface, color, (x, y), size)
+    """Draw grass pattern inside the track, clipped to the inner oval"""
+    min_x = int(min(p[0] for p in inner_points))
+    max_x = int(max(p[0] for p in inner_points))
+    min_y = int(min(p[1] for p in inner_points))
+    max_y = int(max(p[1] for p in inner_points))
+    area = pygame.Rect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+    
+    grass = pygame.Surface(area.size)
+    blit_tiled(grass, INNER_GRASS_TILE)
+    
+    # Stencil: black out everything outside the oval, then key the black away
+    stencil = pygame.Surface(area.size)
+    stencil.fill(BLACK)
+    pygame.draw.polygon(stencil, WHITE, [(x - area.x, y - area.y) for x, y in inner_points])
+    grass.blit(stencil, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+    grass.set_colorkey(BLACK)
+    
+    surface.blit(grass, area)
 
 
 def draw_curbs(surface, outer_points, inner_points):
@@ -308,8 +391,7 @@ def draw_decorations(surface, inner_points):
     pygame.draw.rect(surface, (80, 80, 90), (cx - 90, cy - 50, 180, 100))
     
     # Pit building text
-    font = pygame.font.Font(None, 28)
-    text = font.render("PIT LANE", True, WHITE)
+    text = FONT_STAT.render("PIT LANE", True, WHITE)
     surface.blit(text, (cx - 45, cy - 10))
     
     # Draw some trees around inner area
@@ -368,142 +450,285 @@ def create_car_surface(color):
     return surface
 
 
+def create_car_shadow():
+    """Create the soft shadow drawn under every car"""
+    surface = pygame.Surface((CAR_SIZE_X + 4, CAR_SIZE_Y + 4), pygame.SRCALPHA)
+    pygame.draw.ellipse(surface, (0, 0, 0, 40), (0, 0, CAR_SIZE_X + 4, CAR_SIZE_Y + 4))
+    return surface
+
+
+def create_radar_dot(color):
+    """Create a sensor endpoint dot"""
+    surface = pygame.Surface((13, 13), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (6, 6), 6)
+    return surface.convert_alpha()
+
+
 # Create assets
+GRASS_TILE = create_grass_tile(26, 20, 60, random_grass_shade)
+INNER_GRASS_TILE = create_grass_tile(20, 10, 30, lambda: random.choice((GRASS_LIGHT, GRASS_DARK)))
 create_smooth_track()
 CAR_IMAGES = [create_car_surface(color) for color in CAR_COLORS]
+# Every car image pre-rotated in ROTATION_SPEED steps: CAR_IMAGES_ROT[image][angle // ROTATION_SPEED]
+CAR_IMAGES_ROT = [[pygame.transform.rotate(image, angle).convert_alpha() for angle in range(0, 360, ROTATION_SPEED)]
+                  for image in CAR_IMAGES]
+CAR_SHADOW = create_car_shadow()
+CAR_SHADOW_ROT = [pygame.transform.rotate(CAR_SHADOW, angle).convert_alpha() for angle in range(0, 360, ROTATION_SPEED)]
+# Sensor color by hit distance, from red (near wall) to green (far), and its endpoint dot
+RADAR_COLOR = [(int(255 * danger), int(255 * (1 - danger)), 0)
+               for danger in [1 - dist / SENSOR_LENGTH for dist in range(SENSOR_LENGTH + 1)]]
+RADAR_DOTS = [create_radar_dot(color) for color in RADAR_COLOR]
 
 
-class Car:
-    def __init__(self, car_id=0):
-        self.sprite = CAR_IMAGES[car_id % len(CAR_IMAGES)]
-        self.color = CAR_COLORS[car_id % len(CAR_COLORS)]
+class CarFleet:
+    """All cars of a generation, one NumPy array per attribute
+    
+    Car i is driven by genome i of the generation.
+    """
+    
+    def __init__(self, count):
+        self.count = count
+        self.sprites = [CAR_IMAGES_ROT[i % len(CAR_IMAGES_ROT)] for i in range(count)]
         
         # Start Position - on the oval track (left side, middle)
         # Track center is at WIDTH//2, HEIGHT//2
         # Left side of track is at center_x - outer_rx + track_width/2
-        self.x_pos = WIDTH // 2 - 550 + 50  # Left side of oval
-        self.y_pos = HEIGHT // 2 - CAR_SIZE_Y // 2  # Middle vertically
-        self.angle = 90  # Facing up (counterclockwise direction)
-        self.speed = CAR_SPEED
+        self.x = np.full(count, WIDTH // 2 - 550 + 50, np.float64)  # Left side of oval
+        self.y = np.full(count, HEIGHT // 2 - CAR_SIZE_Y // 2, np.float64)  # Middle vertically
+        self.angle = np.full(count, 90, np.int64)  # Facing up (counterclockwise direction)
+        self.hx = COS_TABLE[self.angle]  # Heading vector, only looked up again when a car turns
+        self.hy = SIN_TABLE[self.angle]
         
         # NEAT Related
-        self.alive = True
-        self.distance_driven = 0
-        self.time_alive = 0
+        self.alive = np.ones(count, bool)
+        self.live = np.arange(count, dtype=np.int64)  # Indices of alive cars, shrunk as cars crash
+        self.distance = np.zeros(count)
         
         # Sensors
-        self.radars = []
-        self.radar_angles = [-90, -45, 0, 45, 90]
+        self.radar_ends = np.zeros((count, len(RADAR_ANGLES), 2), np.int64)
+        self.radar_lengths = np.zeros((count, len(RADAR_ANGLES)), np.int64)
 
     def draw(self, win):
-        """Draw the car with rotation and glow effect"""
-        if not self.alive:
-            return
+        """Draw live cars with rotation and shadow in one batched blit; returns the screen rects touched"""
+        blit_list = []
+        for i in self.live:
+            x, y, angle = self.x[i], self.y[i], self.angle[i]
             
-        # Draw car shadow
-        shadow = pygame.Surface((CAR_SIZE_X + 4, CAR_SIZE_Y + 4), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow, (0, 0, 0, 40), (0, 0, CAR_SIZE_X + 4, CAR_SIZE_Y + 4))
-        rotated_shadow = pygame.transform.rotate(shadow, self.angle)
-        shadow_rect = rotated_shadow.get_rect(center=(self.x_pos + CAR_SIZE_X//2 + 3, 
-                                                       self.y_pos + CAR_SIZE_Y//2 + 3))
-        win.blit(rotated_shadow, shadow_rect.topleft)
-        
-        # Draw car
-        rotated_image = pygame.transform.rotate(self.sprite, self.angle)
-        new_rect = rotated_image.get_rect(
-            center=self.sprite.get_rect(topleft=(self.x_pos, self.y_pos)).center
-        )
-        win.blit(rotated_image, new_rect.topleft)
+            # Draw car shadow
+            rotated_shadow = CAR_SHADOW_ROT[angle % 360 // ROTATION_SPEED]
+            shadow_rect = rotated_shadow.get_rect(center=(x + CAR_SIZE_X//2 + 3, y + CAR_SIZE_Y//2 + 3))
+            blit_list.append((rotated_shadow, shadow_rect.topleft))
+            
+            # Draw car
+            rotated_image = self.sprites[i][angle % 360 // ROTATION_SPEED]
+            new_rect = rotated_image.get_rect(center=CAR_IMAGES[0].get_rect(topleft=(x, y)).center)
+            blit_list.append((rotated_image, new_rect.topleft))
+        
+        return win.blits(blit_list)
 
     def draw_radars(self, win):
-        """Draw sensor lines with gradient effect"""
-        for radar in self.radars:
-            pos, dist = radar
-            danger = 1 - (dist / SENSOR_LENGTH)
-            
-            # Gradient color from green to red
-            r = int(255 * danger)
-            g = int(255 * (1 - danger))
-            color = (r, g, 0)
-            
-            center_x = self.x_pos + CAR_SIZE_X // 2
-            center_y = self.y_pos + CAR_SIZE_Y // 2
-            
-            # Draw line with glow effect
-            pygame.draw.line(win, (*color, 100), (center_x, center_y), pos, 4)
-            pygame.draw.line(win, color, (center_x, center_y), pos, 2)
+        """Draw sensor lines of live cars colored by distance, then all endpoint dots in one blit
+        
+        Returns the screen rects touched.
+        """
+        rects = []
+        dots = []
+        for i in self.live:
+            center = (self.x[i] + CAR_SIZE_X // 2, self.y[i] + CAR_SIZE_Y // 2)
             
-            # Draw endpoint circle with glow
-            pygame.draw.circle(win, (*color, 150), pos, 6)
-            pygame.draw.circle(win, color, pos, 4)
+            for (end_x, end_y), dist in zip(self.radar_ends[i].tolist(), self.radar_lengths[i].tolist()):
+                rects.append(pygame.draw.line(win, RADAR_COLOR[dist], center, (end_x, end_y), 4))
+                dots.append((RADAR_DOTS[dist], (end_x - 6, end_y - 6)))
+        
+        return rects + win.blits(dots)
 
     def check_collision(self):
-        """Check collision using collision surface"""
-        check_x = int(self.x_pos + CAR_SIZE_X // 2)
-        check_y = int(self.y_pos + CAR_SIZE_Y // 2)
+        """Kill live cars whose center is off the track"""
+        live = self.live
+        check_x = (self.x[live] + CAR_SIZE_X // 2).astype(int)
+        check_y = (self.y[live] + CAR_SIZE_Y // 2).astype(int)
         
-        if not (0 <= check_x < WIDTH and 0 <= check_y < HEIGHT):
-            self.alive = False
-            return
-        
-        try:
-            color = COLLISION_SURFACE.get_at((check_x, check_y))
-            if color[0] < 50:  # Black = off track
-                self.alive = False
-        except IndexError:
-            self.alive = False
+        height, width = COLLISION_MASK.shape
+        inside = (check_x >= 0) & (check_x < width) & (check_y >= 0) & (check_y < height)
+        off_track = COLLISION_MASK[np.clip(check_y, 0, height - 1), np.clip(check_x, 0, width - 1)]
+        on_track = inside & (off_track == 0)
+        self.alive[live] = on_track
+        self.live = live[on_track]
+
+    def steer(self, outputs):
+        """Turn live cars by their network outputs, given in the order of self.live"""
+        outputs = np.asarray(outputs)
+        turn = (outputs[:, 0] > 0.5).astype(int) - (outputs[:, 1] > 0.5).astype(int)
+        turning = turn != 0
+        changed = self.live[turning]
+        self.angle[changed] = (self.angle[changed] + ROTATION_SPEED * turn[turning]) % 360
+        self.hx[changed] = COS_TABLE[self.angle[changed]]
+        self.hy[changed] = SIN_TABLE[self.angle[changed]]
 
     def update(self):
-        """Update car position"""
-        self.x_pos += math.cos(math.radians(self.angle)) * self.speed
-        self.y_pos -= math.sin(math.radians(self.angle)) * self.speed
+        """Move every live car forward"""
+        live = self.live
+        self.x[live] += self.hx[live] * CAR_SPEED
+        self.y[live] -= self.hy[live] * CAR_SPEED
         
-        self.distance_driven += self.speed
-        self.time_alive += 1
+        self.distance[live] += CAR_SPEED
         
         self.check_collision()
-        self.update_radars()
 
     def update_radars(self):
-        """Update sensor readings"""
-        self.radars.clear()
-        for degree in self.radar_angles:
-            self.cast_ray(degree)
+        """Cast the rays of all live cars in one batch"""
+        live = self.live
+        self.radar_ends[live], self.radar_lengths[live] = batch_cast_rays(self.x[live], self.y[live], self.angle[live])
 
-    def cast_ray(self, angle_offset):
-        """Cast a ray to detect walls"""
-        length = 0
-        target_angle = math.radians(self.angle + angle_offset)
+    def tick(self, outputs):
+        """Steer, move and sense live cars, in one compiled call when sim_core is built"""
+        if sim_core is None:
+            self.steer(outputs)
+            self.update()
+            self.update_radars()
+            return
         
-        start_x = self.x_pos + CAR_SIZE_X // 2
-        start_y = self.y_pos + CAR_SIZE_Y // 2
+        sim_core.tick(self.x, self.y, self.angle, self.hx, self.hy, self.alive.view(np.uint8), self.distance, self.live,
+                      np.ascontiguousarray(outputs, np.float64), COLLISION_MASK,
+                      COS_TABLE, SIN_TABLE, RADAR_ANGLES_ARRAY, self.radar_ends, self.radar_lengths,
+                      CAR_SPEED, ROTATION_SPEED, SENSOR_LENGTH, RAY_STEP, RAY_COARSE_STEP,
+                      CAR_SIZE_X // 2, CAR_SIZE_Y // 2)
+        self.live = self.live[self.alive[self.live]]
+
+    def get_inputs(self):
+        """Get normalized sensor data of live cars, one row per car"""
+        return self.radar_lengths[self.live] / SENSOR_LENGTH
+
+
+if njit:
+    @njit(cache=True)
+    def _ray_blocked(mask, x, y, cos_a, sin_a, length):
+        """Whether the ray point at length is off the track or off the screen"""
+        end_x = int(x + cos_a * length)
+        end_y = int(y - sin_a * length)
+        height, width = mask.shape
+        return not (0 <= end_x < width and 0 <= end_y < height) or mask[end_y, end_x]
+    
+    @njit(cache=True)
+    def _raycast_all(mask, start_x, start_y, cos_t, sin_t, ends, lengths):
+        """Coarse ray march to the first blocked probe, then bisect down to RAY_STEP"""
+        for i in range(cos_t.shape[0]):
+            for r in range(cos_t.shape[1]):
+                x, y, cos_a, sin_a = start_x[i], start_y[i], cos_t[i, r], sin_t[i, r]
+                
+                clear, hit = 0, SENSOR_LENGTH
+                while clear < SENSOR_LENGTH:
+                    length = min(clear + RAY_COARSE_STEP, SENSOR_LENGTH)
+                    if _ray_blocked(mask, x, y, cos_a, sin_a, length):
+                        hit = length
+                        break
+                    clear = length
+                
+                while hit - clear > RAY_STEP:
+                    middle = clear + (hit - clear) // (2 * RAY_STEP) * RAY_STEP
+                    if _ray_blocked(mask, x, y, cos_a, sin_a, middle):
+                        hit = middle
+                    else:
+                        clear = middle
+                
+                ends[i, r, 0], ends[i, r, 1] = int(x + cos_a * hit), int(y - sin_a * hit)
+                lengths[i, r] = hit
+
+
+def batch_cast_rays(xs, ys, angles):
+    """Cast every radar ray of every given car at once
+    
+    Returns ray end points (N, 5, 2) and hit distances (N, 5).
+    """
+    ray_angles = (np.asarray(angles)[:, None] + RADAR_ANGLES) % 360
+    cos_t, sin_t = COS_TABLE[ray_angles], SIN_TABLE[ray_angles]
+    start_x = np.asarray(xs, float) + CAR_SIZE_X // 2
+    start_y = np.asarray(ys, float) + CAR_SIZE_Y // 2
+    
+    if njit:
+        ends = np.empty(cos_t.shape + (2,), int)
+        lengths = np.empty(cos_t.shape, np.int64)
+        _raycast_all(COLLISION_MASK, start_x, start_y, cos_t, sin_t, ends, lengths)
+        return ends, lengths
+    
+    def blocked(lengths):
+        """Whether the ray points at lengths (N, 5, k) are off the track or off the screen"""
+        sample_x = (start_x[:, None, None] + cos_t[:, :, None] * lengths).astype(int)
+        sample_y = (start_y[:, None, None] - sin_t[:, :, None] * lengths).astype(int)
+        height, width = COLLISION_MASK.shape
+        outside = (sample_x < 0) | (sample_x >= width) | (sample_y < 0) | (sample_y >= height)
+        return outside | (COLLISION_MASK[np.clip(sample_y, 0, height - 1), np.clip(sample_x, 0, width - 1)] != 0)
+    
+    # Coarse probes of every ray: (N, 5, coarse steps)
+    coarse_hits = blocked(RAY_COARSE_STEPS)
+    found = coarse_hits.any(axis=2)
+    hit = np.where(found, RAY_COARSE_STEPS[coarse_hits.argmax(axis=2)], SENSOR_LENGTH)
+    clear = np.where(found, hit - RAY_COARSE_STEP, SENSOR_LENGTH)
+    
+    # Bisect every ray between its last clear and first blocked probe, like the JIT kernel
+    while (hit - clear > RAY_STEP).any():
+        middle = clear + (hit - clear) // (2 * RAY_STEP) * RAY_STEP
+        middle_hits = blocked(middle[:, :, None])[:, :, 0]
+        hit = np.where(middle_hits, middle, hit)
+        clear = np.where(middle_hits, clear, middle)
+    
+    ends = np.stack([(start_x[:, None] + cos_t * hit).astype(int),
+                     (start_y[:, None] - sin_t * hit).astype(int)], axis=2)
+    return ends, hit
+
+
+def can_batch(net):
+    """Whether BatchedNetworks reproduces this net: every node must be a tanh of a sum"""
+    return all(act is neat.activations.tanh_activation and agg is neat.aggregations.sum_aggregation
+               for _, act, agg, _, _, _ in net.node_evals)
+
+
+class BatchedNetworks:
+    """The feed-forward nets of a generation, evaluated for many cars at once
+    
+    Every net is flattened into dense weight rows, one per evaluated node,
+    padded to the largest net. Node k of all nets is computed in the same
+    NumPy step, so a forward pass costs a few array ops per node instead of
+    a Python walk over every net.
+    """
+    
+    def __init__(self, nets):
+        n_inputs = len(nets[0].input_nodes)
+        steps = max(len(net.node_evals) for net in nets)
+        # Value slots: inputs, then evaluated nodes in order, then one that stays 0
+        self.n_inputs = n_inputs
+        self.zero_slot = n_inputs + steps
         
-        end_x, end_y = start_x, start_y
+        self.weights = np.zeros((len(nets), steps, self.zero_slot + 1))
+        self.biases = np.zeros((len(nets), steps))
+        self.responses = np.zeros((len(nets), steps))
+        self.output_slots = np.full((len(nets), len(nets[0].output_nodes)), self.zero_slot)
         
-        while length < SENSOR_LENGTH:
-            length += 5
-            
-            end_x = int(start_x + math.cos(target_angle) * length)
-            end_y = int(start_y - math.sin(target_angle) * length)
-            
-            if not (0 <= end_x < WIDTH and 0 <= end_y < HEIGHT):
-                break
+        for n, net in enumerate(nets):
+            slots = {key: i for i, key in enumerate(net.input_nodes)}
+            for k, (node, _, _, bias, response, links) in enumerate(net.node_evals):
+                for key, weight in links:
+                    self.weights[n, k, slots.get(key, self.zero_slot)] += weight
+                self.biases[n, k] = bias
+                self.responses[n, k] = response
+                slots[node] = n_inputs + k
             
-            try:
-                color = COLLISION_SURFACE.get_at((end_x, end_y))
-                if color[0] < 50:
-                    break
-            except IndexError:
-                break
+            # Outputs that are never evaluated read as 0, like in FeedForwardNetwork
+            for j, key in enumerate(net.output_nodes):
+                self.output_slots[n, j] = slots.get(key, self.zero_slot)
+    
+    def forward(self, rows, inputs):
+        """Outputs (len(rows), outputs) of the nets in rows for one input row each"""
+        values = np.zeros((len(rows), self.zero_slot + 1))
+        values[:, :self.n_inputs] = inputs
+        weights, biases, responses = self.weights[rows], self.biases[rows], self.responses[rows]
         
-        self.radars.append(((end_x, end_y), length))
-
-    def get_data(self):
-        """Get normalized sensor data"""
-        return_data = [0.0] * 5
-        for i, radar in enumerate(self.radars):
-            return_data[i] = radar[1] / SENSOR_LENGTH
-        return return_data
+        for k in range(weights.shape[1]):
+            total = np.einsum("ij,ij->i", weights[:, k], values)
+            # neat's tanh_activation
+            values[:, self.n_inputs + k] = np.tanh(np.clip(2.5 * (biases[:, k] + responses[:, k] * total), -60, 60))
+        
+        return np.take_along_axis(values, self.output_slots[rows], axis=1)
 
 
 def toggle_fullscreen():
@@ -532,29 +757,46 @@ def toggle_fullscreen():
 
 def eval_genomes(genomes, config):
     """Evaluate all genomes for one generation"""
-    global current_generation, best_fitness_ever, restart_requested, quit_requested, paused
+    global current_generation
     current_generation += 1
     
-    cars = []
     ge_list = []
     nets = []
     
     for i, (genome_id, genome) in enumerate(genomes):
-        cars.append(Car(i))
         ge_list.append(genome)
         net = neat.nn.FeedForwardNetwork.create(genome, config)
         nets.append(net)
         genome.fitness = 0
     
+    fleet = CarFleet(len(genomes))
+    
+    # All nets at once when they fit the batched evaluator, else one by one
+    brains = BatchedNetworks(nets) if all(can_batch(net) for net in nets) else None
+    run_cars(fleet, ge_list, nets, brains)
+
+
+def run_cars(fleet, ge_list, nets, brains):
+    """Simulate one generation until every car crashes or time runs out
+    
+    ge_list and nets hold the genomes of the live cars, in the order of fleet.live;
+    brains, when given, holds the nets of all cars indexed by car id.
+    """
+    global best_fitness_ever, restart_requested, quit_requested, paused, turbo
+    
     clock = pygame.time.Clock()
     running = True
     ticks = 0
     max_ticks = 1500
+    dirty = None  # Rects drawn last frame; None forces a full redraw
     
-    while running and len(cars) > 0 and ticks < max_ticks:
-        clock.tick(FPS)
+    while running and len(fleet.live) > 0 and ticks < max_ticks:
+        # Only every few ticks is a frame: the ones that draw and handle input
+        frame = paused or ticks % (TURBO_DRAW_INTERVAL if turbo else DRAW_EVERY) == 0
+        if paused or not turbo:  # The pause screen stays frame limited in turbo mode
+            clock.tick(FPS)
         
-        for event in pygame.event.get():
+        for event in pygame.event.get() if frame else ():
             if event.type == pygame.QUIT:
                 quit_requested = True
                 return
@@ -570,67 +812,107 @@ def eval_genomes(genomes, config):
                 if event.key == pygame.K_s:
                     # Skip to next generation
                     return
+                if event.key == pygame.K_t:
+                    turbo = not turbo
                 if event.key == pygame.K_F11 or event.key == pygame.K_f:
                     toggle_fullscreen()
+                    dirty = None
         
         # Handle pause
         if paused:
             draw_pause_screen()
             pygame.display.flip()
+            dirty = None
             continue
         
         ticks += 1
         
-        # Update cars
-        for i, car in enumerate(cars):
-            if car.alive:
-                ge_list[i].fitness += 0.1
-                
-                inputs = car.get_data()
-                output = nets[i].activate(inputs)
-                
-                if output[0] > 0.5:
-                    car.angle += ROTATION_SPEED
-                if output[1] > 0.5:
-                    car.angle -= ROTATION_SPEED
-                
-                car.update()
-                
-                # Update best fitness
-                if ge_list[i].fitness > best_fitness_ever:
-                    best_fitness_ever = ge_list[i].fitness
+        # Think: one batched pass, or net by net
+        inputs = fleet.get_inputs()
+        if brains:
+            outputs = brains.forward(fleet.live, inputs)
+        else:
+            outputs = [net.activate(x) for net, x in zip(nets, inputs.tolist())]
+        
+        for genome in ge_list:
+            genome.fitness += 0.1
+            
+            # Update best fitness
+            if genome.fitness > best_fitness_ever:
+                best_fitness_ever = genome.fitness
+        
+        # Steer, move and sense the whole fleet at once
+        racing = fleet.live
+        fleet.tick(outputs)
         
-        # Remove dead cars
-        for i in range(len(cars) - 1, -1, -1):
-            if not cars[i].alive:
-                ge_list[i].fitness += cars[i].distance_driven * 0.01
+        # Remove dead cars: credit their distance, then rebuild the lists in one pass
+        alive_mask = fleet.alive[racing]
+        if not alive_mask.all():
+            for i in np.flatnonzero(~alive_mask):
+                ge_list[i].fitness += float(fleet.distance[racing[i]]) * 0.01
                 if ge_list[i].fitness > best_fitness_ever:
                     best_fitness_ever = ge_list[i].fitness
-                cars.pop(i)
-                nets.pop(i)
-                ge_list.pop(i)
+            nets = [net for net, alive in zip(nets, alive_mask) if alive]
+            ge_list = [genome for genome, alive in zip(ge_list, alive_mask) if alive]
         
-        # Drawing
-        WIN.blit(TRACK_SURFACE, (0, 0))
-        WIN.blit(DECORATION_SURFACE, (0, 0))
+        if not frame:
+            continue
+        
+        # Drawing: restore only the background under last frame's sprites
+        if dirty is None:
+            WIN.blit(TRACK_SURFACE, (0, 0))
+            WIN.blit(DECORATION_SURFACE, (0, 0))
+        else:
+            for rect in dirty:
+                WIN.blit(TRACK_SURFACE, rect, rect)
+                WIN.blit(DECORATION_SURFACE, rect, rect)
         
         # Draw sensors first (behind cars)
-        for car in cars:
-            car.draw_radars(WIN)
+        drawn = fleet.draw_radars(WIN)
         
         # Draw cars
-        for car in cars:
-            car.draw(WIN)
+        drawn += fleet.draw(WIN)
         
         # Draw UI
-        draw_advanced_ui(len(cars), len(genomes), ticks, max_ticks)
+        drawn += draw_advanced_ui(len(fleet.live), fleet.count, ticks, max_ticks)
         
-        pygame.display.flip()
+        # Push only what changed, unless that is most of the screen anyway
+        changed = drawn if dirty is None else dirty + drawn
+        if dirty is None or sum(rect.w * rect.h for rect in changed) > WIDTH * HEIGHT // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(changed)
+        dirty = drawn
 
 
-def draw_advanced_ui(alive, total, ticks, max_ticks):
-    """Draw professional-looking UI"""
-    # Main stats panel
+# Rendered surfaces of fixed strings, keyed by (text, font, color)
+_text_cache = {}
+
+
+def render_text(text, font, color):
+    """Render a string once and reuse the surface on later calls"""
+    key = (text, font, color)
+    if key not in _text_cache:
+        _text_cache[key] = font.render(text, True, color)
+    return _text_cache[key]
+
+
+# Pre-rendered characters of the live stat values, one set per value color
+DIGIT_SPRITES = {color: {char: FONT_STAT.render(char, True, color) for char in "0123456789/.-"}
+                 for color in (UI_TEXT, UI_SUCCESS, UI_WARNING, UI_ACCENT)}
+
+
+def blit_number(value, color, right, y):
+    """Blit a numeric string from digit sprites, right-aligned to x = right"""
+    sprites = [DIGIT_SPRITES[color][char] for char in value]
+    x = right - sum(sprite.get_width() for sprite in sprites)
+    for sprite in sprites:
+        WIN.blit(sprite, (x, y))
+        x += sprite.get_width()
+
+
+def create_stats_panel():
+    """Create the static stats panel (gradient, border, title, labels, empty progress bar)"""
     panel_width = 280
     panel_height = 200
     
@@ -646,43 +928,27 @@ def draw_advanced_ui(alive, total, ticks, max_ticks):
     pygame.draw.rect(panel, UI_ACCENT, (0, 0, panel_width, panel_height), 2, border_radius=10)
     
     # Title
-    title_font = pygame.font.Font(None, 36)
-    title = title_font.render("🧠 NEURAL RACING", True, UI_ACCENT)
+    title = render_text("🧠 NEURAL RACING", FONT_TITLE, UI_ACCENT)
     panel.blit(title, (15, 10))
     
     # Separator line
     pygame.draw.line(panel, UI_ACCENT, (15, 45), (panel_width - 15, 45), 2)
     
-    # Stats
-    font = pygame.font.Font(None, 28)
-    stats = [
-        ("Generation", str(current_generation), UI_TEXT),
-        ("Cars Alive", f"{alive}/{total}", UI_SUCCESS if alive > total//2 else UI_WARNING),
-        ("Time", f"{ticks}/{max_ticks}", UI_TEXT),
-        ("Best Fitness", f"{best_fitness_ever:.1f}", UI_ACCENT),
-    ]
-    
+    # Stat labels
     y = 55
-    for label, value, color in stats:
-        # Label
-        label_surf = font.render(f"{label}:", True, (150, 150, 170))
+    for label in ("Generation", "Cars Alive", "Time", "Best Fitness"):
+        label_surf = render_text(f"{label}:", FONT_STAT, (150, 150, 170))
         panel.blit(label_surf, (15, y))
-        # Value
-        value_surf = font.render(value, True, color)
-        panel.blit(value_surf, (panel_width - 15 - value_surf.get_width(), y))
         y += 32
     
-    # Progress bar for time
-    bar_y = y + 5
-    bar_width = panel_width - 30
-    progress = ticks / max_ticks
-    
-    pygame.draw.rect(panel, (50, 50, 60), (15, bar_y, bar_width, 12), border_radius=6)
-    pygame.draw.rect(panel, UI_ACCENT, (15, bar_y, int(bar_width * progress), 12), border_radius=6)
-    
-    WIN.blit(panel, (15, 15))
+    # Progress bar background
+    pygame.draw.rect(panel, (50, 50, 60), (15, y + 5, panel_width - 30, 12), border_radius=6)
     
-    # Legend panel (bottom right)
+    return panel
+
+
+def create_legend_panel():
+    """Create the sensor color legend panel"""
     legend_width = 200
     legend_height = 80
     legend = pygame.Surface((legend_width, legend_height), pygame.SRCALPHA)
@@ -693,25 +959,26 @@ def draw_advanced_ui(alive, total, ticks, max_ticks):
     
     pygame.draw.rect(legend, (80, 80, 100), (0, 0, legend_width, legend_height), 1, border_radius=8)
     
-    small_font = pygame.font.Font(None, 22)
-    legend_text = small_font.render("Sensor Guide:", True, UI_TEXT)
+    legend_text = render_text("Sensor Guide:", FONT_HINT, UI_TEXT)
     legend.blit(legend_text, (10, 8))
     
     # Green indicator
     pygame.draw.circle(legend, (0, 255, 0), (20, 38), 6)
-    safe_text = small_font.render("Safe (far from wall)", True, (150, 255, 150))
+    safe_text = render_text("Safe (far from wall)", FONT_HINT, (150, 255, 150))
     legend.blit(safe_text, (35, 30))
     
     # Red indicator
     pygame.draw.circle(legend, (255, 0, 0), (20, 60), 6)
-    danger_text = small_font.render("Danger (near wall)", True, (255, 150, 150))
+    danger_text = render_text("Danger (near wall)", FONT_HINT, (255, 150, 150))
     legend.blit(danger_text, (35, 52))
     
-    WIN.blit(legend, (WIDTH - legend_width - 15, HEIGHT - legend_height - 15))
-    
-    # Controls panel (bottom left)
+    return legend
+
+
+def create_controls_panel():
+    """Create the key controls panel"""
     controls_width = 220
-    controls_height = 130
+    controls_height = 150
     controls = pygame.Surface((controls_width, controls_height), pygame.SRCALPHA)
     
     for i in range(controls_height):
@@ -720,27 +987,68 @@ def draw_advanced_ui(alive, total, ticks, max_ticks):
     
     pygame.draw.rect(controls, (80, 80, 100), (0, 0, controls_width, controls_height), 1, border_radius=8)
     
-    small_font = pygame.font.Font(None, 22)
-    controls_title = small_font.render("Controls:", True, UI_TEXT)
+    controls_title = render_text("Controls:", FONT_HINT, UI_TEXT)
     controls.blit(controls_title, (10, 8))
     
     control_items = [
         ("[R]", "Restart"),
         ("[P/Space]", "Pause"),
         ("[S]", "Skip Generation"),
+        ("[T]", "Turbo"),
         ("[F/F11]", "Fullscreen"),
         ("[Q/ESC]", "Quit")
     ]
     
     y = 30
     for key, action in control_items:
-        key_surf = small_font.render(key, True, UI_ACCENT)
-        action_surf = small_font.render(action, True, (180, 180, 180))
+        key_surf = render_text(key, FONT_HINT, UI_ACCENT)
+        action_surf = render_text(action, FONT_HINT, (180, 180, 180))
         controls.blit(key_surf, (15, y))
         controls.blit(action_surf, (90, y))
         y += 20
     
-    WIN.blit(controls, (15, HEIGHT - controls_height - 15))
+    return controls
+
+
+# Static UI panels, drawn once; only the stat values and progress change per frame
+UI_STATS_PANEL = create_stats_panel()
+UI_LEGEND_PANEL = create_legend_panel()
+UI_CONTROLS_PANEL = create_controls_panel()
+
+
+def draw_advanced_ui(alive, total, ticks, max_ticks):
+    """Draw professional-looking UI; returns the screen rects of its panels"""
+    # Main stats panel: static background, then this frame's values straight on the window
+    panel_x, panel_y = 15, 15
+    panel_width = UI_STATS_PANEL.get_width()
+    panel_rect = WIN.blit(UI_STATS_PANEL, (panel_x, panel_y))
+    
+    # Stats
+    stats = [
+        (str(current_generation), UI_TEXT),
+        (f"{alive}/{total}", UI_SUCCESS if alive > total//2 else UI_WARNING),
+        (f"{ticks}/{max_ticks}", UI_TEXT),
+        (f"{best_fitness_ever:.1f}", UI_ACCENT),
+    ]
+    
+    y = 55
+    for value, color in stats:
+        blit_number(value, color, panel_x + panel_width - 15, panel_y + y)
+        y += 32
+    
+    # Progress bar for time
+    bar_y = y + 5
+    bar_width = panel_width - 30
+    progress = ticks / max_ticks
+    
+    pygame.draw.rect(WIN, UI_ACCENT, (panel_x + 15, panel_y + bar_y, int(bar_width * progress), 12), border_radius=6)
+    
+    # Legend panel (bottom right) and controls panel (bottom left)
+    legend_rect = WIN.blit(UI_LEGEND_PANEL, (WIDTH - UI_LEGEND_PANEL.get_width() - 15,
+                                             HEIGHT - UI_LEGEND_PANEL.get_height() - 15))
+    controls_rect = WIN.blit(UI_CONTROLS_PANEL, (15, HEIGHT - UI_CONTROLS_PANEL.get_height() - 15))
+    
+    return [panel_rect, legend_rect, controls_rect]
 
 
 def draw_pause_screen():
@@ -751,11 +1059,8 @@ def draw_pause_screen():
     WIN.blit(overlay, (0, 0))
     
     # Pause text
-    font_big = pygame.font.Font(None, 72)
-    font_small = pygame.font.Font(None, 36)
-    
-    pause_text = font_big.render("PAUSED", True, UI_ACCENT)
-    resume_text = font_small.render("Press P or SPACE to resume", True, WHITE)
+    pause_text = render_text("PAUSED", FONT_BIG, UI_ACCENT)
+    resume_text = render_text("Press P or SPACE to resume", FONT_TITLE, WHITE)
     
     WIN.blit(pause_text, (WIDTH // 2 - pause_text.get_width() // 2, HEIGHT // 2 - 50))
     WIN.blit(resume_text, (WIDTH // 2 - resume_text.get_width() // 2, HEIGHT // 2 + 20))
@@ -840,24 +1145,20 @@ def show_completion_screen(winner):
         overlay.fill((0, 0, 0, 180))
         WIN.blit(overlay, (0, 0))
         
-        font_big = pygame.font.Font(None, 72)
-        font_med = pygame.font.Font(None, 42)
-        font_small = pygame.font.Font(None, 32)
-        
         # Title
-        title = font_big.render("🏆 EVOLUTION COMPLETE! 🏆", True, UI_ACCENT)
+        title = render_text("🏆 EVOLUTION COMPLETE! 🏆", FONT_BIG, UI_ACCENT)
         WIN.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 3 - 50))
         
         # Stats
-        gen_text = font_med.render(f"Generations: {current_generation}", True, WHITE)
-        fit_text = font_med.render(f"Best Fitness: {best_fitness_ever:.1f}", True, UI_SUCCESS)
+        gen_text = render_text(f"Generations: {current_generation}", FONT_MED, WHITE)
+        fit_text = render_text(f"Best Fitness: {best_fitness_ever:.1f}", FONT_MED, UI_SUCCESS)
         
         WIN.blit(gen_text, (WIDTH // 2 - gen_text.get_width() // 2, HEIGHT // 2 - 20))
         WIN.blit(fit_text, (WIDTH // 2 - fit_text.get_width() // 2, HEIGHT // 2 + 30))
         
         # Options
-        restart_text = font_small.render("Press [R] to Restart", True, (150, 255, 150))
-        quit_text = font_small.render("Press [Q] or [ESC] to Quit", True, (255, 150, 150))
+        restart_text = render_text("Press [R] to Restart", FONT_OPTION, (150, 255, 150))
+        quit_text = render_text("Press [Q] or [ESC] to Quit", FONT_OPTION, (255, 150, 150))
         
         WIN.blit(restart_text, (WIDTH // 2 - restart_text.get_width() // 2, HEIGHT * 2 // 3 + 20))
         WIN.blit(quit_text, (WIDTH // 2 - quit_text.get_width() // 2, HEIGHT * 2 // 3 + 60))
@@ -879,6 +1180,7 @@ def main():
     print("  • [R] Restart simulation")
     print("  • [P] or [Space] Pause/Resume")
     print("  • [S] Skip to next generation")
+    print("  • [T] Turbo training (or start with HEADLESS=1)")
     print("  • [F] or [F11] Toggle Fullscreen")
     print("  • [Q] or [ESC] Quit game")
     print("  • [X] Close window button")
@@ -0,0 +1,92 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled per-tick car update for self_driving_car.py
+
+Build in place with:  cythonize -i sim_core.pyx
+"""
+
+ctypedef unsigned char uint8
+
+
+cdef inline long long wrap_degrees(long long angle) nogil:
+    """Angle in [0, 360), like Python's % for negative angles"""
+    angle %= 360
+    if angle < 0:
+        angle += 360
+    return angle
+
+
+cdef inline bint ray_blocked(const uint8[:, ::1] mask, double x, double y, double cos_a, double sin_a,
+                             long long length) nogil:
+    """Whether the ray point at length is off the track or off the screen"""
+    cdef long long end_x = <long long>(x + cos_a * length)
+    cdef long long end_y = <long long>(y - sin_a * length)
+    return not (0 <= end_x < mask.shape[1] and 0 <= end_y < mask.shape[0]) or mask[end_y, end_x]
+
+
+def tick(double[::1] xs, double[::1] ys, long long[::1] angles, double[::1] hx, double[::1] hy, uint8[::1] alive, double[::1] distance,
+         const long long[::1] live, const double[:, ::1] outputs, const uint8[:, ::1] mask,
+         const double[::1] cos_table, const double[::1] sin_table, const long long[::1] radar_angles,
+         long long[:, :, ::1] radar_ends, long long[:, ::1] radar_lengths,
+         double speed, long long rot_speed, long long sensor_length, long long ray_step, long long ray_coarse_step,
+         double offset_x, double offset_y):
+    """Steer, move, collide and sense every live car in one pass
+
+    outputs holds one network output row per entry of live. hx, hy are the
+    heading vectors, only looked up again for cars that turn. Cars that
+    leave the track get alive[i] = 0 and keep their last sensor readings.
+    Rays are probed every ray_coarse_step, then bisected down to ray_step.
+    """
+    cdef Py_ssize_t height = mask.shape[0], width = mask.shape[1]
+    cdef Py_ssize_t j, i, r
+    cdef long long turn, ray, length, clear, hit, middle, end_x, end_y
+    cdef double start_x, start_y, cos_a, sin_a
+
+    with nogil:
+        for j in range(live.shape[0]):
+            i = live[j]
+
+            # Steer and move
+            turn = (outputs[j, 0] > 0.5) - (outputs[j, 1] > 0.5)
+            if turn != 0:
+                angles[i] = wrap_degrees(angles[i] + rot_speed * turn)
+                hx[i] = cos_table[angles[i]]
+                hy[i] = sin_table[angles[i]]
+            xs[i] += hx[i] * speed
+            ys[i] -= hy[i] * speed
+            distance[i] += speed
+
+            # Collision at the car center
+            start_x = xs[i] + offset_x
+            start_y = ys[i] + offset_y
+            end_x = <long long>start_x
+            end_y = <long long>start_y
+            if not (0 <= end_x < width and 0 <= end_y < height) or mask[end_y, end_x]:
+                alive[i] = 0
+                continue
+
+            # Radars: coarse march to the first blocked probe, then bisect down to ray_step
+            for r in range(radar_angles.shape[0]):
+                ray = wrap_degrees(angles[i] + radar_angles[r])
+                cos_a = cos_table[ray]
+                sin_a = sin_table[ray]
+
+                clear = 0
+                hit = sensor_length
+                while clear < sensor_length:
+                    length = min(clear + ray_coarse_step, sensor_length)
+                    if ray_blocked(mask, start_x, start_y, cos_a, sin_a, length):
+                        hit = length
+                        break
+                    clear = length
+
+                while hit - clear > ray_step:
+                    middle = clear + (hit - clear) // (2 * ray_step) * ray_step
+                    if ray_blocked(mask, start_x, start_y, cos_a, sin_a, middle):
+                        hit = middle
+                    else:
+                        clear = middle
+
+                radar_ends[i, r, 0] = <long long>(start_x + cos_a * hit)
+                radar_ends[i, r, 1] = <long long>(start_y - sin_a * hit)
+                radar_lengths[i, r] = hit